@@ -0,0 +1,84 @@
+"""
+RE2 support shared by the claims processors
+Compiles extraction patterns with RE2 (linear-time matching) when it is
+installed, matching the way the re module would
+"""
+
+import re
+from typing import Any, Optional
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# re flags and the inline RE2 flag letters they map to
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+# RE2's \s and \d are ASCII-only, while re matches Unicode whitespace and
+# digits in str patterns (the NBSP that PDF text often carries between a
+# label's words). They are rewritten to the equivalent Unicode classes,
+# outside and inside a character class, so both engines match alike.
+_RE2_UNICODE_CLASSES = {
+    's': (r'[\t\n\v\f\r\x1c-\x1f\x85\p{Z}]', r'\t\n\v\f\r\x1c-\x1f\x85\p{Z}'),
+    'd': (r'\p{Nd}', r'\p{Nd}')
+}
+
+
+def unicode_classes(pattern: str) -> Optional[str]:
+    """Rewrite a pattern's whitespace and digit classes for RE2, or None to keep it on re
+
+    Word boundaries and word/negated classes have no RE2 equivalent
+    (RE2's word characters are ASCII-only), so patterns using them stay
+    on re.
+    """
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            if escape in 'bBwWSD':
+                return None
+            if escape in _RE2_UNICODE_CLASSES:
+                parts.append(_RE2_UNICODE_CLASSES[escape][in_class])
+            else:
+                parts.append(pattern[i:i + 2])
+            i += 2
+            continue
+        parts.append(char)
+        i += 1
+        if char == '[' and not in_class:
+            in_class = True
+            # A leading ^ negates and a leading ] is literal, neither ends the class
+            if pattern.startswith('^', i):
+                parts.append('^')
+                i += 1
+            if pattern.startswith(']', i):
+                parts.append(']')
+                i += 1
+        elif char == ']' and in_class:
+            in_class = False
+    return ''.join(parts)
+
+
+def compile_re2(pattern: str, flags: int = 0) -> Optional[Any]:
+    """Compile a pattern with RE2, or return None when RE2 is missing or can't take it"""
+    if re2 is None:
+        return None
+    re2_pattern = unicode_classes(pattern)
+    if re2_pattern is None:
+        return None
+
+    inline_flags = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    options = re2.Options()
+    # Rejected patterns are expected (see below), don't log them
+    options.log_errors = False
+    try:
+        return re2.compile(
+            f"(?{inline_flags}){re2_pattern}" if inline_flags else re2_pattern, options
+        )
+    except re2.error:
+        # RE2 has no lookarounds; patterns using them stay on re
+        return None
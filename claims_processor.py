@@ -3,13 +3,233 @@ Autonomous Insurance Claims Processing Agent
 Extracts, validates, and routes FNOL (First Notice of Loss) documents
 """
 
+import glob
+import hashlib
+import importlib.util
 import json
+import logging
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache, partial
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import pdfplumber
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional
 from pathlib import Path
 
+from _regex import compile_re2
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever extraction or routing logic changes so that cached
+# results from an older pipeline are not reused
+_PIPELINE_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'claims_processor'
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Per-thread Hyperscan scratch spaces, keyed by database. A database's
+# built-in scratch serves one scan at a time (ScratchInUseError otherwise),
+# so threads sharing a class-level database each scan with their own.
+_hyperscan_scratch = threading.local()
+
+
+def _hyperscan_scan(database, data: bytes, on_match):
+    """database.scan() with this thread's scratch space for the database"""
+    scratches = getattr(_hyperscan_scratch, 'scratches', None)
+    if scratches is None:
+        scratches = _hyperscan_scratch.scratches = {}
+    scratch = scratches.get(database)
+    if scratch is None:
+        scratch = scratches[database] = hyperscan.Scratch(database)
+    database.scan(data, match_event_handler=on_match, scratch=scratch)
+
+
+def result_to_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize a result to UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _default_pdf_parser() -> str:
+    """Name of the fastest installed PDF backend (checked without importing it)"""
+    for parser, module_name in (('pymupdf', 'fitz'), ('pdfium', 'pypdfium2')):
+        if importlib.util.find_spec(module_name) is not None:
+            return parser
+    return 'pdfplumber'
+
+
+# Every pattern built by _compile, with its source and flags, so that
+# ClaimsProcessor.field_prefilter() can hand them to Hyperscan
+_COMPILED_PATTERNS: List[tuple] = []
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 (linear-time matching) when available, else re"""
+    compiled = compile_re2(pattern, flags)
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+    _COMPILED_PATTERNS.append((compiled, pattern, flags))
+    return compiled
+
+
+def _search(pattern, text: str, candidates: Optional[set] = None):
+    """pattern.search(text), or None when the prefilter ruled the pattern out"""
+    if candidates is not None and pattern not in candidates:
+        return None
+    return pattern.search(text)
+
+
+# Pattern lists are tried in order and the first pattern that matches
+# anywhere in the document wins. They are deliberately not fused into one
+# document-wide alternation: that returns the leftmost match instead of the
+# highest-priority one, lets one field's match swallow a neighbouring label,
+# and defeats the literal-prefix search the re module does per pattern.
+
+# Policy information patterns
+# The policy number labels are alternatives of one pattern, so the first
+# policy label in the document wins (the insured's, ahead of any "other
+# insurance" section) and the text is scanned once
+_POLICY_RE = _compile(
+    r'POLICY\s*NUMBER[:\s]*([A-Z0-9-]+)'
+    r'|Policy\s*#[:\s]*([A-Z0-9-]+)'
+    r'|POL(?:ICY)?\s*NO[.:]?\s*([A-Z0-9-]+)',
+    re.IGNORECASE
+)
+_NAME_PATTERNS = [
+    _compile(r'NAME\s+OF\s+INSURED[:\s]*([A-Za-z\s,]+?)(?:\n|DATE)', re.IGNORECASE),
+    _compile(r'INSURED[:\s]+([A-Za-z\s,]+?)(?:\n|MAILING)', re.IGNORECASE),
+    _compile(r'Policyholder[:\s]+([A-Za-z\s,]+?)(?:\n)', re.IGNORECASE)
+]
+_EFFECTIVE_DATE_RE = _compile(
+    r'(?:Effective|Policy)\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE
+)
+
+# Incident information patterns
+_DATE_OF_LOSS_PATTERNS = [
+    _compile(r'DATE\s+OF\s+LOSS[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE),
+    _compile(r'Loss\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE),
+    _compile(r'Incident\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE)
+]
+_TIME_PATTERNS = [
+    _compile(r'TIME[:\s]*(\d{1,2}:\d{2})\s*(AM|PM)?', re.IGNORECASE),
+    _compile(r'(?:at|@)\s*(\d{1,2}:\d{2})\s*(AM|PM)?', re.IGNORECASE)
+]
+_LOCATION_PATTERNS = [
+    _compile(r'LOCATION\s+OF\s+LOSS[:\s]*([^\n]+)', re.IGNORECASE),
+    _compile(r'(?:STREET|ADDRESS)[:\s]*([^\n]+?)(?:CITY|STATE|\n)', re.IGNORECASE),
+    _compile(r'(?:Location|Address)[:\s]*([^\n]+)', re.IGNORECASE)
+]
+_CITY_STATE_ZIP_RE = _compile(r'CITY,\s*STATE,\s*ZIP[:\s]*([^\n]+)', re.IGNORECASE)
+_DESC_PATTERNS = [
+    _compile(
+        r'DESCRIPTION\s+OF\s+ACCIDENT[:\s]*([^\n]+(?:\n(?![A-Z\s]+:)[^\n]+)*)',
+        re.IGNORECASE | re.MULTILINE
+    ),
+    _compile(
+        r'(?:Accident|Incident)\s+Description[:\s]*([^\n]+(?:\n[^\n]+)*)',
+        re.IGNORECASE | re.MULTILINE
+    ),
+]
+
+# Involved party patterns
+_CLAIMANT_RE = _compile(r'(?:Claimant|Insured)[:\s]+([A-Za-z\s,]+?)(?:\n|PHONE)', re.IGNORECASE)
+_DRIVER_RE = _compile(r"DRIVER'S\s+NAME\s+AND\s+ADDRESS[:\s]*([^\n]+)", re.IGNORECASE)
+_PHONE_RE = _compile(r'(?:PHONE|Tel)[:\s#]*(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE)
+_EMAIL_RE = _compile(
+    r'E-?MAIL[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', re.IGNORECASE
+)
+
+# Asset detail patterns
+_VEHICLE_ASSET_RE = _compile(r'\b(?:VEHICLE|AUTOMOBILE|CAR|TRUCK|VAN)\b', re.IGNORECASE)
+_PROPERTY_ASSET_RE = _compile(r'\b(?:PROPERTY|BUILDING|HOME|HOUSE)\b', re.IGNORECASE)
+_VIN_RE = _compile(r'V\.?I\.?N\.?[:\s]*([A-HJ-NPR-Z0-9]{17})', re.IGNORECASE)
+_MAKE_RE = _compile(r'MAKE[:\s]*([A-Za-z0-9\s]+?)(?:\n|VEH|YEAR|MODEL)', re.IGNORECASE)
+_MODEL_RE = _compile(r'MODEL[:\s]*([A-Za-z0-9\s]+?)(?:\n|YEAR|BODY|TYPE)', re.IGNORECASE)
+_YEAR_RE = _compile(r'YEAR[:\s]*(\d{4})', re.IGNORECASE)
+_ESTIMATE_PATTERNS = [
+    _compile(r'ESTIMATE\s+AMOUNT[:\s]*\$?\s*([0-9,]+\.?\d*)', re.IGNORECASE),
+    _compile(r'Estimated?\s+Damage[:\s]*\$?\s*([0-9,]+\.?\d*)', re.IGNORECASE),
+    _compile(r'Damage\s+Estimate[:\s]*\$?\s*([0-9,]+\.?\d*)', re.IGNORECASE)
+]
+_DAMAGE_DESC_RE = _compile(r'DESCRIBE\s+DAMAGE[:\s]*([^\n]+)', re.IGNORECASE)
+
+# Patterns that can produce each extracted field, so that a search for
+# only the fields still missing can skip the rest
+_FIELD_PATTERNS: Dict[str, List[Any]] = {
+    'policy_number': [_POLICY_RE],
+    'policyholder_name': _NAME_PATTERNS,
+    'effective_date': [_EFFECTIVE_DATE_RE],
+    'incident_date': _DATE_OF_LOSS_PATTERNS,
+    'incident_time': _TIME_PATTERNS,
+    'incident_location': _LOCATION_PATTERNS,
+    'city_state_zip': [_CITY_STATE_ZIP_RE],
+    'incident_description': _DESC_PATTERNS,
+    'claimant_name': [_CLAIMANT_RE],
+    'driver_name': [_DRIVER_RE],
+    'contact_phone': [_PHONE_RE],
+    'contact_email': [_EMAIL_RE],
+    'asset_type': [_VEHICLE_ASSET_RE, _PROPERTY_ASSET_RE],
+    'asset_id': [_VIN_RE],
+    'vin': [_VIN_RE],
+    'vehicle_make': [_MAKE_RE],
+    'vehicle_model': [_MODEL_RE],
+    'vehicle_year': [_YEAR_RE],
+    'estimated_damage': _ESTIMATE_PATTERNS,
+    'damage_description': [_DAMAGE_DESC_RE]
+}
+
+
+def _lacks_field(fields: Dict[str, Any], key: str) -> bool:
+    """Whether fields has no real value for key
+
+    An 'Unknown' asset type only means no asset keyword was seen, so it
+    counts as missing.
+    """
+    value = fields.get(key)
+    return not value or value == 'Unknown'
+
+# Form labels ("POLICY NUMBER:", "DATE OF LOSS:") identifying a template
+_TEMPLATE_LABEL_RE = _compile(r"([A-Z][A-Z' ]{6,}[A-Z]):")
+
+# Extractors specialised for known FNOL form templates, keyed by
+# template_signature(); documents from other templates use the generic
+# pattern-based extractors
+_TEMPLATE_REGISTRY: Dict[str, Callable[[str], Dict[str, Any]]] = {}
+
+
+def template_signature(text: str) -> str:
+    """Fingerprint a form layout from the labels on its first page"""
+    labels = sorted(set(_TEMPLATE_LABEL_RE.findall(text[:2000])))
+    return hashlib.sha1('\n'.join(labels).encode('utf-8')).hexdigest()
+
+
+def register_template(signature: str):
+    """Decorator registering a specialised field extractor for one form template"""
+    def decorator(extractor: Callable[[str], Dict[str, Any]]):
+        _TEMPLATE_REGISTRY[signature] = extractor
+        return extractor
+    return decorator
+
 
 class ClaimsProcessor:
     """Main claims processing agent"""
@@ -17,6 +237,23 @@ class ClaimsProcessor:
     # Routing thresholds
     FAST_TRACK_THRESHOLD = 25000
     
+    # Field extraction scans this many leading characters of the text first;
+    # matches there win, and the rest of the document only fills fields
+    # still missing (keyword checks always scan the whole document)
+    EXTRACTION_HEAD_CHARS = 20000
+    
+    # Text searched after a cut (the end of the head, or a page break with
+    # stop_when_complete) starts this many characters before the cut, so a
+    # field broken across it is still found
+    OVERLAP_CHARS = 500
+    
+    # PDF backends accepted by the `parser` argument, fastest first
+    PDF_PARSERS = ('pymupdf', 'pdfium', 'pdfplumber')
+    
+    # Pages handed to each worker process when page_workers is set; every
+    # batch re-opens the PDF, so batches must be large enough to pay for it
+    PAGE_BATCH_SIZE = 20
+    
     # Mandatory fields for validation
     MANDATORY_FIELDS = [
         'policy_number',
@@ -33,49 +270,327 @@ class ClaimsProcessor:
     # Injury-related keywords
     INJURY_KEYWORDS = ['injury', 'injured', 'hurt', 'medical', 'hospital', 'ambulance']
     
-    def __init__(self):
-        self.extracted_data = {}
-        self.missing_fields = []
+    # Collision-related keywords
+    COLLISION_KEYWORDS = ['collision', 'accident', 'crash']
+    
+    # AcroForm field name -> extracted field key for fillable forms, whose
+    # typed-in values are read from the form widgets (PyMuPDF only). Empty
+    # by default: field names depend on the form edition in use.
+    FORM_FIELD_MAP: ClassVar[Dict[str, str]] = {}
+    
+    # Keyword sets, Hyperscan database and Aho-Corasick automaton, shared by
+    # all instances and built on first use by keyword_matchers() (per class,
+    # so subclasses overriding the keyword lists get their own)
+    _keyword_matchers: ClassVar[Optional[tuple]] = None
+    
+    # Hyperscan prefilter over the field patterns, built on first use by
+    # field_prefilter(); False once building it has been tried and failed
+    _field_prefilter: ClassVar[Any] = None
+    
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        stop_when_complete: bool = False,
+        parser: Optional[str] = None,
+        page_workers: Optional[int] = None
+    ):
+        if parser is not None and parser not in self.PDF_PARSERS:
+            raise ValueError(
+                f"Unknown PDF parser {parser!r}; expected one of {', '.join(self.PDF_PARSERS)}"
+            )
+        # PDF backend for file paths; None picks the fastest one installed
+        self.parser = parser
+        # Results are cached by document content hash when a cache dir is set
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Stop reading pages once every mandatory field has been extracted;
+        # keyword checks then only see the pages that were read
+        self.stop_when_complete = stop_when_complete
+        # Extract the pages of long PDFs in this many worker processes
+        # (None extracts in this process, which is faster for short forms)
+        self.page_workers = page_workers
+    
+    @classmethod
+    def keyword_matchers(cls) -> tuple:
+        """Return (keyword sets, Hyperscan database, automaton), building them once per class"""
+        if cls.__dict__.get('_keyword_matchers') is None:
+            keyword_sets = cls.build_keyword_sets()
+            cls._keyword_matchers = (
+                keyword_sets,
+                cls.build_keyword_database(keyword_sets),
+                cls.build_keyword_automaton(keyword_sets)
+            )
+        return cls._keyword_matchers
+    
+    @classmethod
+    def build_keyword_sets(cls) -> Dict[str, frozenset]:
+        """Deduplicated keyword sets keyed by the category reported by scan_keywords"""
+        return {
+            'fraud': frozenset(cls.FRAUD_KEYWORDS),
+            'injury': frozenset(cls.INJURY_KEYWORDS),
+            'collision': frozenset(cls.COLLISION_KEYWORDS)
+        }
+    
+    @staticmethod
+    def build_keyword_database(keyword_sets: Dict[str, frozenset]):
+        """Compile one Hyperscan expression per keyword category (None without hyperscan)"""
+        if hyperscan is None:
+            return None
+        
+        categories = list(keyword_sets)
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[
+                '|'.join(re.escape(keyword) for keyword in sorted(keyword_sets[category])).encode()
+                for category in categories
+            ],
+            ids=list(range(len(categories))),
+            elements=len(categories),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(categories)
+        )
+        return database, categories
+    
+    @staticmethod
+    def build_keyword_automaton(keyword_sets: Dict[str, frozenset]):
+        """Build an Aho-Corasick automaton over all keywords (None without pyahocorasick)"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for category, keywords in keyword_sets.items():
+            for keyword in keywords:
+                categories = automaton.get(keyword, set())
+                categories.add(category)
+                automaton.add_word(keyword, categories)
+        automaton.make_automaton()
+        return automaton
+    
+    @classmethod
+    def field_prefilter(cls) -> Optional[tuple]:
+        """Return (Hyperscan database, patterns) over every field pattern, or None"""
+        if cls._field_prefilter is None:
+            cls._field_prefilter = cls.build_field_database() or False
+        return cls._field_prefilter or None
+    
+    @staticmethod
+    def build_field_database() -> Optional[tuple]:
+        """Compile the field patterns into one Hyperscan prefilter database
+        
+        In prefilter mode Hyperscan may report patterns that do not really
+        match (lookaheads are approximated) but never misses one that does,
+        so the regex engines only run patterns it reported.
+        """
+        if hyperscan is None:
+            return None
+        
+        patterns = [compiled for compiled, _, _ in _COMPILED_PATTERNS]
+        common_flags = (
+            hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH |
+            hyperscan.HS_FLAG_ALLOWEMPTY | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        )
+        flags = []
+        for _, _, pattern_flags in _COMPILED_PATTERNS:
+            pattern_hs_flags = common_flags
+            for re_flag, hs_flag in (
+                (re.IGNORECASE, hyperscan.HS_FLAG_CASELESS),
+                (re.MULTILINE, hyperscan.HS_FLAG_MULTILINE),
+                (re.DOTALL, hyperscan.HS_FLAG_DOTALL)
+            ):
+                if pattern_flags & re_flag:
+                    pattern_hs_flags |= hs_flag
+            flags.append(pattern_hs_flags)
         
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text content from PDF file"""
+        database = hyperscan.Database()
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
+            database.compile(
+                expressions=[source.encode() for _, source, _ in _COMPILED_PATTERNS],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=flags
+            )
+        except hyperscan.error as e:
+            logger.debug("Field patterns not prefiltered: %s", e)
+            return None
+        return database, patterns
+    
+    def prefilter_patterns(self, text: str) -> Optional[set]:
+        """Patterns Hyperscan finds a possible match for, in one scan of the text"""
+        prefilter = self.field_prefilter()
+        if prefilter is None:
+            return None
+        
+        database, patterns = prefilter
+        candidates = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            candidates.add(patterns[pattern_id])
+        
+        # 'replace' keeps the input valid UTF-8 for HS_FLAG_UTF8
+        _hyperscan_scan(database, text.encode('utf-8', 'replace'), on_match)
+        return candidates
+    
+    def scan_keywords(self, text_lower: str) -> set:
+        """Return the keyword categories present in the lowercased text, scanning it once"""
+        keyword_sets, keyword_database, keyword_automaton = self.keyword_matchers()
+        
+        if keyword_database is not None:
+            database, categories = keyword_database
+            hits = set()
+            
+            def on_match(expression_id, start, end, flags, context):
+                hits.add(categories[expression_id])
+                # Stop scanning once every category has been seen
+                return len(hits) == len(categories)
+            
+            try:
+                _hyperscan_scan(database, text_lower.encode('utf-8'), on_match)
+            except hyperscan.ScanTerminated:
+                # Raised when on_match stopped the scan early
+                pass
+            return hits
+        
+        if keyword_automaton is not None:
+            hits = set()
+            for _, categories in keyword_automaton.iter(text_lower):
+                hits.update(categories)
+            return hits
+        
+        return {
+            category
+            for category, keywords in keyword_sets.items()
+            if any(keyword in text_lower for keyword in keywords)
+        }
+        
+    def extract_text_from_pdf(self, pdf) -> str:
+        """Extract text content from a PDF file path or an already-open PDF"""
+        if self.page_workers and isinstance(pdf, (str, Path)):
+            return self.extract_text_in_workers(pdf)
+        return "".join(self.iter_pdf_pages(pdf))
+    
+    def extract_text_in_workers(self, pdf_path) -> str:
+        """Extract a PDF's text with batches of pages spread over worker processes"""
+        try:
+            with self.open_pdf(pdf_path) as pdf:
+                page_count = self.count_pages(pdf)
+                # Not worth starting workers for a single batch
+                if page_count <= self.PAGE_BATCH_SIZE:
+                    return "".join(self.iter_document_pages(pdf))
+            
+            batch_starts = range(0, page_count, self.PAGE_BATCH_SIZE)
+            worker = partial(
+                _extract_page_batch,
+                str(pdf_path),
+                self.parser or _default_pdf_parser(),
+                self.PAGE_BATCH_SIZE,
+                page_count
+            )
+            with ProcessPoolExecutor(max_workers=self.page_workers) as executor:
+                return "".join(executor.map(worker, batch_starts))
+        except Exception as e:
+            raise Exception(f"Error reading PDF: {str(e)}")
+    
+    def iter_pdf_pages(self, pdf, page_numbers: Optional[range] = None):
+        """Yield the text of each PDF page, reading pages only as they are consumed
+        
+        `pdf` is a file path, or an open fitz.Document / pdfplumber.PDF /
+        pypdfium2.PdfDocument so callers that already hold the document
+        avoid re-opening it. `page_numbers` limits reading to those pages.
+        """
+        try:
+            if isinstance(pdf, (str, Path)):
+                with self.open_pdf(pdf) as document:
+                    yield from self.iter_document_pages(document, page_numbers)
+            else:
+                yield from self.iter_document_pages(pdf, page_numbers)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
-    def extract_policy_info(self, text: str) -> Dict[str, Any]:
+    @contextmanager
+    def open_pdf(self, pdf_path):
+        """Open a PDF file with the configured backend"""
+        # PDF libraries are imported on first use so that importing this
+        # module (e.g. to call determine_route on stored fields) stays cheap
+        
+        # PyMuPDF and PDFium decode text natively; pdfplumber builds a
+        # Python object per character, so it is only the fallback
+        parser = self.parser or _default_pdf_parser()
+        
+        if parser == 'pymupdf':
+            import fitz
+            with fitz.open(pdf_path) as doc:
+                yield doc
+        elif parser == 'pdfium':
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                yield pdf
+            finally:
+                pdf.close()
+        else:
+            import pdfplumber
+            with pdfplumber.open(pdf_path) as pdf:
+                yield pdf
+    
+    def count_pages(self, pdf) -> int:
+        """Number of pages in an open PDF of any supported backend"""
+        if hasattr(pdf, 'load_page'):
+            return pdf.page_count
+        if hasattr(pdf, 'pages'):
+            return len(pdf.pages)
+        return len(pdf)
+    
+    def iter_document_pages(self, pdf, page_numbers: Optional[range] = None):
+        """Yield page text from an open PDF of any supported backend"""
+        if hasattr(pdf, 'load_page'):
+            return self.iter_pymupdf_pages(pdf, page_numbers)
+        if hasattr(pdf, 'pages'):
+            return self.iter_pdfplumber_pages(pdf, page_numbers)
+        return self.iter_pdfium_pages(pdf, page_numbers)
+    
+    def iter_pymupdf_pages(self, doc, page_numbers: Optional[range] = None):
+        """Yield page text from an open fitz.Document"""
+        pages = doc if page_numbers is None else (doc.load_page(i) for i in page_numbers)
+        for page in pages:
+            page_text = page.get_text("text")
+            # Scanned / image-only pages have no text layer
+            if page_text:
+                yield page_text + "\n"
+    
+    def iter_pdfplumber_pages(self, pdf, page_numbers: Optional[range] = None):
+        """Yield page text from an open pdfplumber.PDF"""
+        pages = pdf.pages if page_numbers is None else [pdf.pages[i] for i in page_numbers]
+        for page in pages:
+            # Scanned / image-only page - skip text layout entirely
+            if not page.chars:
+                continue
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text + "\n"
+    
+    def iter_pdfium_pages(self, pdf, page_numbers: Optional[range] = None):
+        """Yield page text from an open pypdfium2.PdfDocument"""
+        pages = pdf if page_numbers is None else (pdf[i] for i in page_numbers)
+        for page in pages:
+            textpage = page.get_textpage()
+            # Scanned / image-only page - nothing to extract
+            if textpage.count_chars() == 0:
+                continue
+            page_text = textpage.get_text_range()
+            if page_text:
+                # PDFium separates lines with CRLF; patterns expect \n
+                yield page_text.replace('\r\n', '\n') + "\n"
+    
+    def extract_policy_info(self, text: str, candidates: Optional[set] = None) -> Dict[str, Any]:
         """Extract policy-related information"""
         policy_info = {}
         
         # Extract policy number
-        policy_patterns = [
-            r'POLICY\s*NUMBER[:\s]*([A-Z0-9-]+)',
-            r'Policy\s*#[:\s]*([A-Z0-9-]+)',
-            r'POL(?:ICY)?\s*NO[.:]?\s*([A-Z0-9-]+)'
-        ]
-        
-        for pattern in policy_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                policy_info['policy_number'] = match.group(1).strip()
-                break
+        match = _search(_POLICY_RE, text, candidates)
+        if match:
+            policy_info['policy_number'] = match.group(match.lastindex).strip()
         
         # Extract policyholder name
-        name_patterns = [
-            r'NAME\s+OF\s+INSURED[:\s]*([A-Za-z\s,]+?)(?:\n|DATE)',
-            r'INSURED[:\s]+([A-Za-z\s,]+?)(?:\n|MAILING)',
-            r'Policyholder[:\s]+([A-Za-z\s,]+?)(?:\n)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _NAME_PATTERNS:
+            match = _search(pattern, text, candidates)
             if match:
                 name = match.group(1).strip()
                 # Clean up name (remove extra spaces, etc.)
@@ -84,38 +599,26 @@ class ClaimsProcessor:
                 break
         
         # Extract effective dates (if present)
-        date_pattern = r'(?:Effective|Policy)\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        match = re.search(date_pattern, text, re.IGNORECASE)
+        match = _search(_EFFECTIVE_DATE_RE, text, candidates)
         if match:
             policy_info['effective_date'] = match.group(1)
         
         return policy_info
     
-    def extract_incident_info(self, text: str) -> Dict[str, Any]:
+    def extract_incident_info(self, text: str, candidates: Optional[set] = None) -> Dict[str, Any]:
         """Extract incident-related information"""
         incident_info = {}
         
         # Extract date of loss
-        date_patterns = [
-            r'DATE\s+OF\s+LOSS[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Loss\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Incident\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_OF_LOSS_PATTERNS:
+            match = _search(pattern, text, candidates)
             if match:
                 incident_info['incident_date'] = match.group(1)
                 break
         
         # Extract time
-        time_patterns = [
-            r'TIME[:\s]*(\d{1,2}:\d{2})\s*(AM|PM)?',
-            r'(?:at|@)\s*(\d{1,2}:\d{2})\s*(AM|PM)?'
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TIME_PATTERNS:
+            match = _search(pattern, text, candidates)
             if match:
                 time_str = match.group(1)
                 am_pm = match.group(2) if match.lastindex >= 2 else ''
@@ -123,14 +626,8 @@ class ClaimsProcessor:
                 break
         
         # Extract location
-        location_patterns = [
-            r'LOCATION\s+OF\s+LOSS[:\s]*([^\n]+)',
-            r'(?:STREET|ADDRESS)[:\s]*([^\n]+?)(?:CITY|STATE|\n)',
-            r'(?:Location|Address)[:\s]*([^\n]+)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _LOCATION_PATTERNS:
+            match = _search(pattern, text, candidates)
             if match:
                 location = match.group(1).strip()
                 if location and len(location) > 5:  # Ensure it's meaningful
@@ -138,19 +635,13 @@ class ClaimsProcessor:
                     break
         
         # Extract city, state, zip
-        city_state_pattern = r'CITY,\s*STATE,\s*ZIP[:\s]*([^\n]+)'
-        match = re.search(city_state_pattern, text, re.IGNORECASE)
+        match = _search(_CITY_STATE_ZIP_RE, text, candidates)
         if match:
             incident_info['city_state_zip'] = match.group(1).strip()
         
         # Extract description
-        desc_patterns = [
-            r'DESCRIPTION\s+OF\s+ACCIDENT[:\s]*([^\n]+(?:\n(?![A-Z\s]+:)[^\n]+)*)',
-            r'(?:Accident|Incident)\s+Description[:\s]*([^\n]+(?:\n[^\n]+)*)',
-        ]
-        
-        for pattern in desc_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _DESC_PATTERNS:
+            match = _search(pattern, text, candidates)
             if match:
                 description = match.group(1).strip()
                 # Take first reasonable chunk
@@ -160,80 +651,66 @@ class ClaimsProcessor:
         
         return incident_info
     
-    def extract_involved_parties(self, text: str) -> Dict[str, Any]:
+    def extract_involved_parties(self, text: str, candidates: Optional[set] = None) -> Dict[str, Any]:
         """Extract information about involved parties"""
         parties_info = {}
         
         # Extract claimant (often same as insured)
-        claimant_pattern = r'(?:Claimant|Insured)[:\s]+([A-Za-z\s,]+?)(?:\n|PHONE)'
-        match = re.search(claimant_pattern, text, re.IGNORECASE)
+        match = _search(_CLAIMANT_RE, text, candidates)
         if match:
             parties_info['claimant_name'] = match.group(1).strip()
         
         # Extract driver information
-        driver_pattern = r"DRIVER'S\s+NAME\s+AND\s+ADDRESS[:\s]*([^\n]+)"
-        match = re.search(driver_pattern, text, re.IGNORECASE)
+        match = _search(_DRIVER_RE, text, candidates)
         if match:
             parties_info['driver_name'] = match.group(1).strip()
         
-        # Extract phone numbers
-        phone_patterns = r'(?:PHONE|Tel)[:\s#]*(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})'
-        phones = re.findall(phone_patterns, text, re.IGNORECASE)
-        if phones:
-            parties_info['contact_phone'] = phones[0]
+        # Extract phone number (first one listed)
+        match = _search(_PHONE_RE, text, candidates)
+        if match:
+            parties_info['contact_phone'] = match.group(1)
         
         # Extract email
-        email_pattern = r'E-?MAIL[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        match = re.search(email_pattern, text, re.IGNORECASE)
+        match = _search(_EMAIL_RE, text, candidates)
         if match:
             parties_info['contact_email'] = match.group(1)
         
         return parties_info
     
-    def extract_asset_details(self, text: str) -> Dict[str, Any]:
+    def extract_asset_details(self, text: str, candidates: Optional[set] = None) -> Dict[str, Any]:
         """Extract asset/vehicle information"""
         asset_info = {}
         
         # Determine asset type
-        if re.search(r'\b(?:VEHICLE|AUTOMOBILE|CAR|TRUCK|VAN)\b', text, re.IGNORECASE):
+        if _search(_VEHICLE_ASSET_RE, text, candidates):
             asset_info['asset_type'] = 'Vehicle'
-        elif re.search(r'\b(?:PROPERTY|BUILDING|HOME|HOUSE)\b', text, re.IGNORECASE):
+        elif _search(_PROPERTY_ASSET_RE, text, candidates):
             asset_info['asset_type'] = 'Property'
         else:
             asset_info['asset_type'] = 'Unknown'
         
         # Extract VIN
-        vin_pattern = r'V\.?I\.?N\.?[:\s]*([A-HJ-NPR-Z0-9]{17})'
-        match = re.search(vin_pattern, text, re.IGNORECASE)
+        match = _search(_VIN_RE, text, candidates)
         if match:
             asset_info['asset_id'] = match.group(1)
             asset_info['vin'] = match.group(1)
         
         # Extract vehicle details
-        make_pattern = r'MAKE[:\s]*([A-Za-z0-9\s]+?)(?:\n|VEH|YEAR|MODEL)'
-        match = re.search(make_pattern, text, re.IGNORECASE)
+        match = _search(_MAKE_RE, text, candidates)
         if match:
             asset_info['vehicle_make'] = match.group(1).strip()
         
-        model_pattern = r'MODEL[:\s]*([A-Za-z0-9\s]+?)(?:\n|YEAR|BODY|TYPE)'
-        match = re.search(model_pattern, text, re.IGNORECASE)
+        match = _search(_MODEL_RE, text, candidates)
         if match:
             asset_info['vehicle_model'] = match.group(1).strip()
         
-        year_pattern = r'YEAR[:\s]*(\d{4})'
-        match = re.search(year_pattern, text, re.IGNORECASE)
+        match = _search(_YEAR_RE, text, candidates)
         if match:
             asset_info['vehicle_year'] = match.group(1)
         
         # Extract damage estimate
-        estimate_patterns = [
-            r'ESTIMATE\s+AMOUNT[:\s]*\$?\s*([0-9,]+\.?\d*)',
-            r'Estimated?\s+Damage[:\s]*\$?\s*([0-9,]+\.?\d*)',
-            r'Damage\s+Estimate[:\s]*\$?\s*([0-9,]+\.?\d*)'
-        ]
-        
-        for pattern in estimate_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ESTIMATE_PATTERNS:
+            match = _search(pattern, text, candidates)
             if match:
                 amount = match.group(1).replace(',', '')
                 try:
@@ -243,19 +720,17 @@ class ClaimsProcessor:
                 break
         
         # Extract damage description
-        damage_desc_pattern = r'DESCRIBE\s+DAMAGE[:\s]*([^\n]+)'
-        match = re.search(damage_desc_pattern, text, re.IGNORECASE)
+        match = _search(_DAMAGE_DESC_RE, text, candidates)
         if match:
             asset_info['damage_description'] = match.group(1).strip()
         
         return asset_info
     
-    def determine_claim_type(self, text: str, extracted_data: Dict) -> str:
+    def determine_claim_type(self, keyword_hits: set, extracted_data: Dict) -> str:
         """Determine the type of claim"""
-        text_lower = text.lower()
         
         # Check for injury claims
-        if any(keyword in text_lower for keyword in self.INJURY_KEYWORDS):
+        if 'injury' in keyword_hits:
             return 'injury'
         
         # Check for property damage
@@ -264,57 +739,255 @@ class ClaimsProcessor:
         
         # Check for vehicle collision
         if 'vehicle' in extracted_data.get('asset_type', '').lower():
-            if any(word in text_lower for word in ['collision', 'accident', 'crash']):
+            if 'collision' in keyword_hits:
                 return 'vehicle_collision'
             return 'vehicle_damage'
         
         return 'general'
     
-    def check_fraud_indicators(self, text: str) -> bool:
-        """Check for potential fraud indicators in the text"""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.FRAUD_KEYWORDS)
+    def check_fraud_indicators(self, keyword_hits: set) -> bool:
+        """Check for potential fraud indicators in the scanned keywords"""
+        return 'fraud' in keyword_hits
     
-    def process_claim(self, pdf_path: str) -> Dict[str, Any]:
-        """Main processing function for a claim document"""
+    def cache_path(self, pdf_path: str) -> Path:
+        """Cache file for a document, keyed by pipeline version and content hash"""
+        digest = hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+        mode = "-partial" if self.stop_when_complete else ""
+        # Backends lay text out differently, so an explicitly chosen one
+        # gets its own entries
+        if self.parser:
+            mode += f"-{self.parser}"
+        return self.cache_dir / f"v{_PIPELINE_VERSION}{mode}-{digest}.json"
+    
+    def load_cached_result(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load a previously processed result, if present"""
+        try:
+            data = cache_file.read_bytes()
+            result = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return None
+        result['processingTimestamp'] = datetime.now().isoformat()
+        return result
+    
+    def save_cached_result(self, cache_file: Path, result: Dict[str, Any]):
+        """Write a result to the cache atomically"""
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(result_to_json(result, indent=False))
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def extract_form_fields(self, pdf) -> Dict[str, Any]:
+        """Read the FORM_FIELD_MAP fields from a fillable PDF's form widgets"""
+        if not self.FORM_FIELD_MAP:
+            return {}
+        
+        if isinstance(pdf, (str, Path)):
+            try:
+                with self.open_pdf(pdf) as document:
+                    return self.extract_form_fields(document)
+            except Exception as e:
+                raise Exception(f"Error reading PDF: {str(e)}")
+        
+        # Only PyMuPDF exposes the form widgets
+        if not hasattr(pdf, 'load_page'):
+            logger.debug(
+                "Form fields not read: %s documents do not expose widgets",
+                type(pdf).__module__.split('.')[0]
+            )
+            return {}
+        
+        import fitz
         
-        # Extract text from PDF
-        text = self.extract_text_from_pdf(pdf_path)
+        form_fields = {}
+        for page in pdf:
+            # Text fields only: checkboxes and radio buttons hold states
+            # such as 'Yes'/'Off', not field values
+            for widget in page.widgets(types=[fitz.PDF_WIDGET_TYPE_TEXT]):
+                key = self.FORM_FIELD_MAP.get(widget.field_name)
+                if not key or not widget.field_value or form_fields.get(key):
+                    continue
+                value = str(widget.field_value).strip()
+                if key == 'estimated_damage':
+                    try:
+                        form_fields[key] = float(value.replace(',', '').replace('$', ''))
+                    except ValueError:
+                        pass
+                elif value:
+                    form_fields[key] = value
+        return form_fields
+    
+    def extract_fields(self, text: str, keys: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Run every field extractor over the text
+        
+        `keys` limits the search to the patterns of those fields; other
+        fields are then left out, except the 'Unknown' asset type default.
+        """
+        # Known form template - use its specialised extractor
+        signature = template_signature(text)
+        template_extractor = _TEMPLATE_REGISTRY.get(signature)
+        if template_extractor is not None:
+            return template_extractor(text)
+        logger.debug("No template extractor for signature %s", signature)
         
-        # Extract all fields
         extracted_fields = {}
         
+        # Patterns that can match at all (None without Hyperscan)
+        candidates = self.prefilter_patterns(text)
+        if keys is not None:
+            wanted = {pattern for key in keys for pattern in _FIELD_PATTERNS[key]}
+            candidates = wanted if candidates is None else candidates & wanted
+        
         # Policy information
-        policy_info = self.extract_policy_info(text)
+        policy_info = self.extract_policy_info(text, candidates)
         extracted_fields.update(policy_info)
         
         # Incident information
-        incident_info = self.extract_incident_info(text)
+        incident_info = self.extract_incident_info(text, candidates)
         extracted_fields.update(incident_info)
         
         # Involved parties
-        parties_info = self.extract_involved_parties(text)
+        parties_info = self.extract_involved_parties(text, candidates)
         extracted_fields.update(parties_info)
         
         # Asset details
-        asset_info = self.extract_asset_details(text)
+        asset_info = self.extract_asset_details(text, candidates)
         extracted_fields.update(asset_info)
         
+        return extracted_fields
+    
+    def find_missing_fields(self, extracted_fields: Dict[str, Any]) -> List[str]:
+        """List mandatory fields that are absent or empty, in MANDATORY_FIELDS order"""
+        return [field for field in self.MANDATORY_FIELDS if not extracted_fields.get(field)]
+    
+    def missing_field_keys(self, extracted_fields: Dict[str, Any]) -> List[str]:
+        """Extractable fields that extracted_fields has no real value for"""
+        return [key for key in _FIELD_PATTERNS if _lacks_field(extracted_fields, key)]
+    
+    def fill_missing_fields(self, extracted_fields: Dict[str, Any], new_fields: Dict[str, Any]):
+        """Copy new_fields into extracted_fields for keys it has no real value for"""
+        for key, value in new_fields.items():
+            if value and _lacks_field(extracted_fields, key) and not (
+                key in extracted_fields and _lacks_field(new_fields, key)
+            ):
+                extracted_fields[key] = value
+    
+    def has_mandatory_fields(self, extracted_fields: Dict[str, Any]) -> bool:
+        """Check the extracted mandatory fields (claim_type is derived afterwards)
+        
+        An 'Unknown' asset type does not count, since a later page may
+        still name the asset.
+        """
+        return not any(
+            _lacks_field(extracted_fields, field)
+            for field in self.MANDATORY_FIELDS if field != 'claim_type'
+        )
+    
+    def extract_until_complete(self, pdf) -> tuple:
+        """Read pages until the mandatory fields are found; return (text, fields)
+        
+        Each page is searched once, together with the last
+        OVERLAP_CHARS of the page before it so that a field broken
+        across a page boundary is still found. As with the head in the
+        default mode, fields found on earlier pages win: later pages are
+        only searched for fields still missing.
+        """
+        pages = []
+        extracted_fields = {}
+        overlap = ""
+        for page_text in self.iter_pdf_pages(pdf):
+            pages.append(page_text)
+            if len(pages) == 1:
+                extracted_fields = self.extract_fields(page_text)
+            else:
+                missing_keys = self.missing_field_keys(extracted_fields)
+                if missing_keys:
+                    self.fill_missing_fields(
+                        extracted_fields, self.extract_fields(overlap + page_text, missing_keys)
+                    )
+            if self.has_mandatory_fields(extracted_fields):
+                break
+            overlap = page_text[-self.OVERLAP_CHARS:]
+        return "".join(pages), extracted_fields
+    
+    def process_claim(self, pdf_path) -> Dict[str, Any]:
+        """Main processing function for a claim document
+        
+        `pdf_path` may also be an already-open fitz.Document, pdfplumber.PDF
+        or pypdfium2.PdfDocument; such documents are not cached.
+        """
+        
+        # Reuse the result for a document that was already processed
+        cache_file = None
+        if self.cache_dir is not None and isinstance(pdf_path, (str, Path)):
+            cache_file = self.cache_path(pdf_path)
+            cached = self.load_cached_result(cache_file)
+            if cached is not None:
+                return cached
+        
+        # Open the file once so form and text extraction share the document
+        # (page workers open the file themselves, so they get the path)
+        if isinstance(pdf_path, (str, Path)) and not self.page_workers:
+            with ExitStack() as stack:
+                try:
+                    document = stack.enter_context(self.open_pdf(pdf_path))
+                except Exception as e:
+                    raise Exception(f"Error reading PDF: {str(e)}")
+                result = self.process_claim(document)
+            if cache_file is not None:
+                self.save_cached_result(cache_file, result)
+            return result
+        
+        # Values typed into a fillable form
+        form_fields = self.extract_form_fields(pdf_path)
+        
+        if self.stop_when_complete:
+            # Extract page by page, stopping once the mandatory fields are in
+            text, extracted_fields = self.extract_until_complete(pdf_path)
+        else:
+            # Extract text from PDF
+            text = self.extract_text_from_pdf(pdf_path)
+            
+            # Extract all fields from the head of the document, where FNOL
+            # forms put most fields; the rest of a longer document is only
+            # used for fields the head did not provide (e.g. an estimate
+            # on a later page, which still decides the route)
+            head = text[:self.EXTRACTION_HEAD_CHARS]
+            extracted_fields = self.extract_fields(head)
+            
+            if len(text) > len(head):
+                rest = text[self.EXTRACTION_HEAD_CHARS - self.OVERLAP_CHARS:]
+                missing_keys = self.missing_field_keys(extracted_fields)
+                if missing_keys:
+                    self.fill_missing_fields(
+                        extracted_fields, self.extract_fields(rest, missing_keys)
+                    )
+        
+        # Form values are what was entered, so they win over text matches;
+        # fields the form does not map keep their text matches
+        extracted_fields.update(form_fields)
+        
+        text_lower = text.lower()
+        
+        # Scan fraud/injury/collision keywords in one pass
+        keyword_hits = self.scan_keywords(text_lower)
+        
         # Determine claim type
-        claim_type = self.determine_claim_type(text, extracted_fields)
+        claim_type = self.determine_claim_type(keyword_hits, extracted_fields)
         extracted_fields['claim_type'] = claim_type
         
         # Check for missing mandatory fields
-        missing_fields = []
-        for field in self.MANDATORY_FIELDS:
-            if field not in extracted_fields or not extracted_fields[field]:
-                missing_fields.append(field)
+        missing_fields = self.find_missing_fields(extracted_fields)
         
         # Determine routing
         route, reasoning = self.determine_route(
             extracted_fields, 
             missing_fields, 
-            text
+            keyword_hits
         )
         
         # Build result
@@ -326,13 +999,39 @@ class ClaimsProcessor:
             "processingTimestamp": datetime.now().isoformat()
         }
         
+        if cache_file is not None:
+            self.save_cached_result(cache_file, result)
+        
         return result
     
+    def process_claims(self, pdf_paths: List[str]) -> List[Dict[str, Any]]:
+        """Process several claim documents in turn, in input order
+        
+        Documents that fail are logged and left out (see iter_claims).
+        """
+        return [result for _, result in self.iter_claims(pdf_paths)]
+    
+    def iter_claims(self, pdf_paths: List[str]) -> Iterator[tuple]:
+        """Yield (path, result) for each claim document as soon as it is processed
+        
+        The compiled patterns, keyword matchers and prefilter are set up
+        once and reused for every document. A document that cannot be
+        processed is logged with its traceback and skipped, so one bad
+        file does not end the batch.
+        """
+        for pdf_path in pdf_paths:
+            try:
+                result = self.process_claim(pdf_path)
+            except Exception as e:
+                logger.exception("Error processing %s: %s", pdf_path, e)
+                continue
+            yield pdf_path, result
+    
     def determine_route(
         self, 
         extracted_fields: Dict[str, Any], 
         missing_fields: List[str],
-        full_text: str
+        keyword_hits: set
     ) -> tuple:
         """Determine routing and provide reasoning"""
         
@@ -348,7 +1047,7 @@ class ClaimsProcessor:
             return route, reasoning
         
         # Rule 2: Check for fraud indicators
-        if self.check_fraud_indicators(full_text):
+        if self.check_fraud_indicators(keyword_hits):
             route = "Investigation Queue"
             reasoning_parts.append(
                 "Potential fraud indicators detected in claim description"
@@ -391,33 +1090,119 @@ class ClaimsProcessor:
         return route, reasoning
 
 
+def _extract_page_batch(
+    pdf_path: str,
+    parser: str,
+    batch_size: int,
+    page_count: int,
+    start: int
+) -> str:
+    """Extract the text of one batch of pages in a worker process"""
+    page_numbers = range(start, min(start + batch_size, page_count))
+    return "".join(ClaimsProcessor(parser=parser).iter_pdf_pages(pdf_path, page_numbers))
+
+
+def _process_claim_worker(
+    pdf_path: str,
+    cache_dir: Optional[str] = None,
+    parser: Optional[str] = None
+) -> Dict[str, Any]:
+    """Process a single claim in a worker process
+    
+    A document that fails gets {"file": path, "error": message} as its
+    result, so one bad document doesn't abort the rest of the batch.
+    """
+    try:
+        return ClaimsProcessor(cache_dir=cache_dir, parser=parser).process_claim(pdf_path)
+    except Exception as e:
+        logger.exception("Error processing %s: %s", pdf_path, e)
+        return {"file": str(pdf_path), "error": str(e)}
+
+
+def process_many(
+    pdf_paths: List[str],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    parser: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Process several claim documents in parallel, one worker process per core
+    
+    Results come back in the order of `pdf_paths`; see _process_claim_worker
+    for the result of a document that fails.
+    """
+    worker = partial(_process_claim_worker, cache_dir=cache_dir, parser=parser)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, pdf_paths))
+
+
+def collect_pdf_paths(args: List[str]) -> List[str]:
+    """Expand command-line arguments (files, directories, glob patterns) into PDF paths"""
+    pdf_paths = []
+    for arg in args:
+        if Path(arg).is_dir():
+            pdf_paths.extend(sorted(str(p) for p in Path(arg).glob('*.pdf')))
+        elif any(ch in arg for ch in '*?['):
+            pdf_paths.extend(sorted(glob.glob(arg)))
+        else:
+            pdf_paths.append(arg)
+    return pdf_paths
+
+
 def main():
     """Main entry point for the claims processor"""
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python claims_processor.py <path_to_fnol_pdf>")
+    args = sys.argv[1:]
+    
+    # --cache reuses results for documents that were already processed
+    cache_dir = None
+    if '--cache' in args:
+        args = [arg for arg in args if arg != '--cache']
+        cache_dir = str(DEFAULT_CACHE_DIR)
+    
+    if not args:
+        print("Usage: python claims_processor.py [--cache] <path_to_fnol_pdf | directory | glob> [...]")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
+    pdf_paths = collect_pdf_paths(args)
     
-    if not Path(pdf_path).exists():
-        print(f"Error: File not found - {pdf_path}")
+    if not pdf_paths:
+        print(f"Error: No PDF files found - {' '.join(args)}")
         sys.exit(1)
     
-    # Process the claim
-    processor = ClaimsProcessor()
-    result = processor.process_claim(pdf_path)
+    for pdf_path in pdf_paths:
+        if not Path(pdf_path).exists():
+            print(f"Error: File not found - {pdf_path}")
+            sys.exit(1)
     
-    # Output as JSON
-    print(json.dumps(result, indent=2))
+    # Process the claims (in parallel when there is more than one)
+    if len(pdf_paths) == 1:
+        results = [_process_claim_worker(pdf_paths[0], cache_dir=cache_dir)]
+    else:
+        results = process_many(pdf_paths, cache_dir=cache_dir)
     
-    # Optionally save to file
-    output_file = Path(pdf_path).stem + "_processed.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    failed = 0
+    for pdf_path, result in zip(pdf_paths, results):
+        if 'error' in result:
+            failed += 1
+            print(f"Error: Could not process {pdf_path} - {result['error']}")
+            continue
+        
+        # Output as JSON
+        result_json = result_to_json(result)
+        print(result_json.decode('utf-8'))
+        
+        # Save next to the input, so same-named files in different
+        # directories don't overwrite each other
+        pdf_file = Path(pdf_path)
+        output_file = pdf_file.with_name(pdf_file.stem + "_processed.json")
+        output_file.write_bytes(result_json)
+        
+        print(f"\n✓ Results saved to: {output_file}")
     
-    print(f"\n✓ Results saved to: {output_file}")
+    if failed:
+        print(f"\n✗ {failed} of {len(pdf_paths)} documents failed")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
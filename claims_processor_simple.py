@@ -3,15 +3,183 @@ Autonomous Insurance Claims Processing Agent (Simplified Version)
 Works with pre-extracted text or PDF files
 """
 
+import importlib.util
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
+from _regex import compile_re2
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile with RE2 when it is installed and accepts the pattern, else with re"""
+    # RE2 has no lookaheads, so the accident description patterns that
+    # stop at the next label line stay on re
+    compiled = compile_re2(pattern, flags)
+    if compiled is not None:
+        return compiled
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=None)
+def _pdf_backend() -> Optional[str]:
+    """Name of the fastest installed PDF library, or None (checked without importing it)"""
+    for module_name in ('fitz', 'pdfplumber', 'PyPDF2'):
+        if importlib.util.find_spec(module_name) is not None:
+            return module_name
+    return None
+
+# Text files at least this large are decoded straight from a memory map,
+# skipping the full bytes copy that a plain read() makes first
+MMAP_THRESHOLD = 256 * 1024
+
+# Set CLAIMS_DEBUG in the environment to get full tracebacks from main()
+DEBUG = bool(os.environ.get('CLAIMS_DEBUG'))
+
+
+# Each field keeps its own ordered pattern list (first pattern to match wins).
+# Combining every pattern into one finditer() scan is not equivalent: a
+# greedy match such as the DOTALL phone pattern consumes the text holding
+# later labels, so those fields are never seen.
+# re.Scanner does not help either: it tokenizes from the start of the text,
+# stopping at the first position no pattern matches, and its alternation
+# picks the leftmost match rather than the highest-priority pattern.
+
+# Date value shared by the effective date and date of loss patterns
+_DATE = r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
+
+# Policy information patterns
+_POLICY_PATTERNS = [
+    _compile(r'POLICY\s*NUMBER[:\s]*([A-Z0-9-]+)', re.IGNORECASE),
+    _compile(r'Policy\s*#[:\s]*([A-Z0-9-]+)', re.IGNORECASE),
+    _compile(r'POL(?:ICY)?\s*NO\.?[:\s]*([A-Z0-9-]+)', re.IGNORECASE),
+    _compile(r'Policy\s*No\.?[:\s]*([A-Z0-9-]+)', re.IGNORECASE)
+]
+_NAME_PATTERNS = [
+    _compile(r'NAME\s+OF\s+INSURED\s*\([^)]+\)[:\s]*([A-Za-z\s,\.]+?)(?:\n|INSURED)', re.IGNORECASE),
+    _compile(r'INSURED[:\s]+([A-Za-z\s,\.]+?)(?:\n|MAILING|ADDRESS)', re.IGNORECASE),
+    _compile(r'Policyholder[:\s]+([A-Za-z\s,\.]+?)(?:\n)', re.IGNORECASE),
+    _compile(r'Insured[:\s]*Name[:\s]*([A-Za-z\s,\.]+?)(?:\n)', re.IGNORECASE)
+]
+_EFFECTIVE_DATE_PATTERNS = [
+    _compile(r'Effective\s+Date[:\s]*' + _DATE, re.IGNORECASE),
+    _compile(r'Policy\s+Date[:\s]*' + _DATE, re.IGNORECASE)
+]
+
+# Incident information patterns
+_DATE_OF_LOSS_PATTERNS = [
+    _compile(r'DATE\s+OF\s+LOSS\s+AND\s+TIME[:\s]*' + _DATE, re.IGNORECASE),
+    _compile(r'DATE\s+OF\s+LOSS[:\s]*' + _DATE, re.IGNORECASE),
+    _compile(r'Loss\s+Date[:\s]*' + _DATE, re.IGNORECASE),
+    _compile(r'Incident\s+Date[:\s]*' + _DATE, re.IGNORECASE),
+    _compile(r'DATE\s*\(MM/DD/YYYY\)[:\s]*' + _DATE, re.IGNORECASE)
+]
+_TIME_PATTERNS = [
+    _compile(r'TIME[:\s]*(\d{1,2}:\d{2})\s*(AM|PM)', re.IGNORECASE),
+    _compile(r'at\s*(\d{1,2}:\d{2})\s*(AM|PM)', re.IGNORECASE),
+    _compile(r'(\d{1,2}:\d{2})\s*(AM|PM)', re.IGNORECASE)
+]
+_LOCATION_PATTERNS = [
+    _compile(
+        r'LOCATION\s+OF\s+LOSS[:\s]*STREET[:\s]*([^\n]+?)(?:CITY|COUNTRY|\n\n)',
+        re.IGNORECASE | re.MULTILINE
+    ),
+    _compile(r'STREET[:\s]*([^\n]+?)(?:CITY|COUNTRY|STATE)', re.IGNORECASE | re.MULTILINE),
+    _compile(r'(?:Location|Address)[:\s]*([^\n]+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE)
+]
+_CITY_PATTERNS = [
+    _compile(r'CITY,\s*STATE,\s*ZIP[:\s]*([^\n]+)', re.IGNORECASE),
+    _compile(r'City[:\s]*([A-Za-z\s]+),?\s*([A-Z]{2})\s*(\d{5})', re.IGNORECASE)
+]
+_COUNTRY_RE = _compile(r'COUNTRY[:\s]*([A-Za-z\s]+?)(?:\n|CITY)', re.IGNORECASE)
+_DESC_PATTERNS = [
+    _compile(
+        r'DESCRIPTION\s+OF\s+ACCIDENT[:\s]*\([^)]+\)[:\s]*([^\n]+(?:\n(?![A-Z\s]+:)[^\n]+){0,5})',
+        re.IGNORECASE | re.MULTILINE
+    ),
+    _compile(
+        r'DESCRIPTION\s+OF\s+ACCIDENT[:\s]*([^\n]+(?:\n(?![A-Z\s]+:)[^\n]+){0,5})',
+        re.IGNORECASE | re.MULTILINE
+    ),
+    _compile(
+        r'Accident\s+Description[:\s]*([^\n]+(?:\n[^\n]+){0,5})',
+        re.IGNORECASE | re.MULTILINE
+    ),
+]
+
+# Involved party patterns
+_DRIVER_PATTERNS = [
+    _compile(r"DRIVER'S\s+NAME\s+AND\s+ADDRESS[:\s]*([^\n]+)", re.IGNORECASE),
+    _compile(r"Driver[:\s]+([A-Za-z\s,\.]+?)(?:\n|PHONE|ADDRESS)", re.IGNORECASE)
+]
+_OWNER_PATTERNS = [
+    _compile(r"OWNER'S\s+NAME\s+AND\s+ADDRESS[:\s]*([^\n]+)", re.IGNORECASE),
+    _compile(r"Owner[:\s]+([A-Za-z\s,\.]+?)(?:\n|PHONE)", re.IGNORECASE)
+]
+_PHONE_RE = _compile(
+    r'(?:PHONE|Tel|Contact).*?(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})', re.IGNORECASE | re.DOTALL
+)
+# Separators stripped from extracted phone numbers
+_PHONE_DELETE = str.maketrans('', '', '-. ')
+_EMAIL_RE = _compile(
+    r'E-?MAIL\s*ADDRESS[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', re.IGNORECASE
+)
+
+# Asset detail patterns
+_VEHICLE_ASSET_RE = _compile(
+    r'\b(?:AUTOMOBILE|VEHICLE|CAR|TRUCK|VAN|INSURED\s+VEHICLE)\b', re.IGNORECASE
+)
+_PROPERTY_ASSET_RE = _compile(r'\b(?:PROPERTY|BUILDING|HOME|HOUSE)\b', re.IGNORECASE)
+_VIN_RE = _compile(r'V\.?I\.?N\.?[:\s]*([A-HJ-NPR-Z0-9]{17})', re.IGNORECASE)
+_PLATE_RE = _compile(r'PLATE\s+NUMBER[:\s]*([A-Z0-9-]+)', re.IGNORECASE)
+# No optional "VEH #" prefix: it never changes the captured year and it
+# stops re from searching for the YEAR literal directly
+_YEAR_RE = _compile(r'YEAR[:\s]*(\d{4})', re.IGNORECASE)
+_MAKE_RE = _compile(r'MAKE[:\s]*([A-Za-z0-9\s]+?)(?:\s+VEH|\s+YEAR|\s+MODEL|:|\n)', re.IGNORECASE)
+_MODEL_RE = _compile(r'MODEL[:\s]*([A-Za-z0-9\s]+?)(?:\s+BODY|\s+TYPE|:|\n)', re.IGNORECASE)
+_BODY_RE = _compile(r'BODY[:\s]*([A-Za-z0-9\s]+?)(?:\s+MODEL|\s+TYPE|:|\n)', re.IGNORECASE)
+_ESTIMATE_PATTERNS = [
+    _compile(r'ESTIMATE\s+AMOUNT[:\s]*\$?\s*([0-9,]+\.?\d*)', re.IGNORECASE),
+    _compile(r'Estimated?\s+Damage[:\s]*\$?\s*([0-9,]+\.?\d*)', re.IGNORECASE),
+    _compile(r'Damage\s+Estimate[:\s]*\$?\s*([0-9,]+\.?\d*)', re.IGNORECASE),
+    _compile(r'\$\s*([0-9,]+\.?\d*)\s*(?:damage|estimate)', re.IGNORECASE)
+]
+_DAMAGE_DESC_PATTERNS = [
+    _compile(r'DESCRIBE\s+DAMAGE[:\s]*([^\n]+?)(?:\n[A-Z\s]+:|$)', re.IGNORECASE | re.MULTILINE),
+    _compile(r'Damage\s+Description[:\s]*([^\n]+)', re.IGNORECASE | re.MULTILINE)
+]
+
+# Fraud phrasing beyond the plain keywords (matched against lowercased text)
+_SUSPICIOUS_PATTERNS = [
+    _compile(r'seems?\s+(?:fake|staged|suspicious)'),
+    _compile(r'(?:might|could)\s+be\s+fraud'),
+    _compile(r'doesn\'?t\s+add\s+up')
+]
+
 
 class ClaimsProcessor:
-    """Main claims processing agent"""
+    """
+    Main claims processing agent
+    
+    Instances hold no per-claim state, so one processor can be shared by
+    several threads (as process_claims_batch does).
+    """
     
     # Routing thresholds
     FAST_TRACK_THRESHOLD = 25000
@@ -32,62 +200,62 @@ class ClaimsProcessor:
     # Injury-related keywords
     INJURY_KEYWORDS = ['injury', 'injured', 'hurt', 'medical', 'hospital', 'ambulance', 'emergency']
     
-    def __init__(self):
-        self.extracted_data = {}
-        self.missing_fields = []
-        
-    def extract_text_from_file(self, file_path: str) -> str:
+    # Keywords used to classify the claim type
+    INJURY_INDICATORS = ['injured', 'injury', 'extent of injury', 'medical', 'hospital']
+    COLLISION_KEYWORDS = ['collision', 'accident', 'crash', 'hit', 'struck']
+    
+    # (keyword sets, automaton), built on first use
+    _keyword_matchers = None
+    
+    def extract_text_from_file(self, file_path: Union[str, Path]) -> str:
         """Extract text content from file (PDF or TXT)"""
         try:
             file_path = Path(file_path)
+            suffix = file_path.suffix.lower()
             
             # If it's a text file, just read it
-            if file_path.suffix.lower() == '.txt':
+            if suffix == '.txt':
+                if file_path.stat().st_size >= MMAP_THRESHOLD:
+                    return self.read_large_text_file(file_path)
                 with open(file_path, 'r', encoding='utf-8') as f:
                     return f.read()
             
             # For PDF files, try different methods
-            elif file_path.suffix.lower() == '.pdf':
-                # Try pdfplumber first
-                try:
+            elif suffix == '.pdf':
+                # PDF libraries are only imported here, on the first PDF, so
+                # text-only runs don't pay for them
+                backend = _pdf_backend()
+                
+                # PyMuPDF is by far the fastest at plain text extraction
+                if backend == 'fitz':
+                    import fitz
+                    with fitz.open(file_path) as doc:
+                        return "".join(
+                            doc.load_page(i).get_text("text") + "\n"
+                            for i in range(doc.page_count)
+                        )
+                
+                if backend == 'pdfplumber':
                     import pdfplumber
-                    text = ""
+                    parts = []
                     with pdfplumber.open(file_path) as pdf:
                         for page in pdf.pages:
                             page_text = page.extract_text()
                             if page_text:
-                                text += page_text + "\n"
-                    return text
-                except ImportError:
-                    pass
+                                parts.append(page_text + "\n")
+                    return "".join(parts)
                 
-                # Try PyPDF2
-                try:
+                if backend == 'PyPDF2':
                     import PyPDF2
-                    text = ""
                     with open(file_path, 'rb') as f:
                         pdf_reader = PyPDF2.PdfReader(f)
-                        for page in pdf_reader.pages:
-                            text += page.extract_text() + "\n"
-                    return text
-                except ImportError:
-                    pass
-                
-                # Try pymupdf/fitz
-                try:
-                    import fitz
-                    text = ""
-                    doc = fitz.open(file_path)
-                    for page in doc:
-                        text += page.get_text() + "\n"
-                    doc.close()
-                    return text
-                except ImportError:
-                    pass
+                        return "".join(
+                            page.extract_text() + "\n" for page in pdf_reader.pages
+                        )
                 
                 raise Exception(
-                    "No PDF library available. Please install pdfplumber, PyPDF2, or pymupdf.\n"
-                    "Run: pip install pdfplumber"
+                    "No PDF library available. Please install pymupdf, pdfplumber, or PyPDF2.\n"
+                    "Run: pip install pymupdf"
                 )
             
             else:
@@ -96,34 +264,31 @@ class ClaimsProcessor:
         except Exception as e:
             raise Exception(f"Error reading file: {str(e)}")
     
+    def read_large_text_file(self, file_path: Path) -> str:
+        """Decode a large UTF-8 text file from a memory map"""
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+        
+        # Same newline handling as reading in text mode
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
     def extract_policy_info(self, text: str) -> Dict[str, Any]:
         """Extract policy-related information"""
         policy_info = {}
         
         # Extract policy number - multiple patterns
-        policy_patterns = [
-            r'POLICY\s*NUMBER[:\s]*([A-Z0-9-]+)',
-            r'Policy\s*#[:\s]*([A-Z0-9-]+)',
-            r'POL(?:ICY)?\s*NO\.?[:\s]*([A-Z0-9-]+)',
-            r'Policy\s*No\.?[:\s]*([A-Z0-9-]+)'
-        ]
-        
-        for pattern in policy_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _POLICY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 policy_info['policy_number'] = match.group(1).strip()
                 break
         
         # Extract policyholder name
-        name_patterns = [
-            r'NAME\s+OF\s+INSURED\s*\([^)]+\)[:\s]*([A-Za-z\s,\.]+?)(?:\n|INSURED)',
-            r'INSURED[:\s]+([A-Za-z\s,\.]+?)(?:\n|MAILING|ADDRESS)',
-            r'Policyholder[:\s]+([A-Za-z\s,\.]+?)(?:\n)',
-            r'Insured[:\s]*Name[:\s]*([A-Za-z\s,\.]+?)(?:\n)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 name = match.group(1).strip()
                 # Clean up name (remove extra spaces, commas at end)
@@ -134,12 +299,8 @@ class ClaimsProcessor:
                     break
         
         # Extract effective dates (if present)
-        date_patterns = [
-            r'Effective\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Policy\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EFFECTIVE_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 policy_info['effective_date'] = match.group(1)
                 break
@@ -151,29 +312,15 @@ class ClaimsProcessor:
         incident_info = {}
         
         # Extract date of loss
-        date_patterns = [
-            r'DATE\s+OF\s+LOSS\s+AND\s+TIME[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'DATE\s+OF\s+LOSS[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Loss\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Incident\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'DATE\s*\(MM/DD/YYYY\)[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_OF_LOSS_PATTERNS:
+            match = pattern.search(text)
             if match:
                 incident_info['incident_date'] = match.group(1)
                 break
         
         # Extract time
-        time_patterns = [
-            r'TIME[:\s]*(\d{1,2}:\d{2})\s*(AM|PM)',
-            r'at\s*(\d{1,2}:\d{2})\s*(AM|PM)',
-            r'(\d{1,2}:\d{2})\s*(AM|PM)'
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TIME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 time_str = match.group(1)
                 am_pm = match.group(2) if match.lastindex >= 2 else ''
@@ -181,14 +328,8 @@ class ClaimsProcessor:
                 break
         
         # Extract location - multiple approaches
-        location_patterns = [
-            r'LOCATION\s+OF\s+LOSS[:\s]*STREET[:\s]*([^\n]+?)(?:CITY|COUNTRY|\n\n)',
-            r'STREET[:\s]*([^\n]+?)(?:CITY|COUNTRY|STATE)',
-            r'(?:Location|Address)[:\s]*([^\n]+?)(?:\n|$)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 location = match.group(1).strip()
                 # Clean up location
@@ -198,30 +339,20 @@ class ClaimsProcessor:
                     break
         
         # Extract city, state, zip
-        city_patterns = [
-            r'CITY,\s*STATE,\s*ZIP[:\s]*([^\n]+)',
-            r'City[:\s]*([A-Za-z\s]+),?\s*([A-Z]{2})\s*(\d{5})'
-        ]
-        for pattern in city_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CITY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 incident_info['city_state_zip'] = match.group(0).strip()
                 break
         
         # Extract country
-        country_match = re.search(r'COUNTRY[:\s]*([A-Za-z\s]+?)(?:\n|CITY)', text, re.IGNORECASE)
+        country_match = _COUNTRY_RE.search(text)
         if country_match:
             incident_info['country'] = country_match.group(1).strip()
         
         # Extract description
-        desc_patterns = [
-            r'DESCRIPTION\s+OF\s+ACCIDENT[:\s]*\([^)]+\)[:\s]*([^\n]+(?:\n(?![A-Z\s]+:)[^\n]+){0,5})',
-            r'DESCRIPTION\s+OF\s+ACCIDENT[:\s]*([^\n]+(?:\n(?![A-Z\s]+:)[^\n]+){0,5})',
-            r'Accident\s+Description[:\s]*([^\n]+(?:\n[^\n]+){0,5})',
-        ]
-        
-        for pattern in desc_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _DESC_PATTERNS:
+            match = pattern.search(text)
             if match:
                 description = match.group(1).strip()
                 # Clean and limit description
@@ -238,12 +369,8 @@ class ClaimsProcessor:
         parties_info = {}
         
         # Extract driver information
-        driver_patterns = [
-            r"DRIVER'S\s+NAME\s+AND\s+ADDRESS[:\s]*([^\n]+)",
-            r"Driver[:\s]+([A-Za-z\s,\.]+?)(?:\n|PHONE|ADDRESS)"
-        ]
-        for pattern in driver_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DRIVER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 driver = match.group(1).strip()
                 if len(driver) > 2:
@@ -251,29 +378,22 @@ class ClaimsProcessor:
                     break
         
         # Extract owner information
-        owner_patterns = [
-            r"OWNER'S\s+NAME\s+AND\s+ADDRESS[:\s]*([^\n]+)",
-            r"Owner[:\s]+([A-Za-z\s,\.]+?)(?:\n|PHONE)"
-        ]
-        for pattern in owner_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _OWNER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 owner = match.group(1).strip()
                 if len(owner) > 2:
                     parties_info['owner_name'] = owner
                     break
         
-        # Extract phone numbers
-        phone_pattern = r'(?:PHONE|Tel|Contact).*?(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})'
-        phones = re.findall(phone_pattern, text, re.IGNORECASE | re.DOTALL)
-        if phones:
+        # Extract the first phone number
+        match = _PHONE_RE.search(text)
+        if match:
             # Clean phone number
-            phone = phones[0].replace('-', '').replace('.', '').replace(' ', '')
-            parties_info['contact_phone'] = phone
+            parties_info['contact_phone'] = match.group(1).translate(_PHONE_DELETE)
         
         # Extract email
-        email_pattern = r'E-?MAIL\s*ADDRESS[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        match = re.search(email_pattern, text, re.IGNORECASE)
+        match = _EMAIL_RE.search(text)
         if match:
             parties_info['contact_email'] = match.group(1)
         
@@ -284,67 +404,54 @@ class ClaimsProcessor:
         asset_info = {}
         
         # Determine asset type
-        if re.search(r'\b(?:AUTOMOBILE|VEHICLE|CAR|TRUCK|VAN|INSURED\s+VEHICLE)\b', text, re.IGNORECASE):
+        if _VEHICLE_ASSET_RE.search(text):
             asset_info['asset_type'] = 'Vehicle'
-        elif re.search(r'\b(?:PROPERTY|BUILDING|HOME|HOUSE)\b', text, re.IGNORECASE):
+        elif _PROPERTY_ASSET_RE.search(text):
             asset_info['asset_type'] = 'Property'
         else:
             asset_info['asset_type'] = 'Unknown'
         
         # Extract VIN
-        vin_pattern = r'V\.?I\.?N\.?[:\s]*([A-HJ-NPR-Z0-9]{17})'
-        match = re.search(vin_pattern, text, re.IGNORECASE)
+        match = _VIN_RE.search(text)
         if match:
             vin = match.group(1).strip()
             asset_info['asset_id'] = vin
             asset_info['vin'] = vin
         
         # Extract plate number
-        plate_pattern = r'PLATE\s+NUMBER[:\s]*([A-Z0-9-]+)'
-        match = re.search(plate_pattern, text, re.IGNORECASE)
+        match = _PLATE_RE.search(text)
         if match:
             asset_info['plate_number'] = match.group(1).strip()
         
         # Extract vehicle year
-        year_pattern = r'(?:VEH\s*#\s*)?YEAR[:\s]*(\d{4})'
-        match = re.search(year_pattern, text, re.IGNORECASE)
+        match = _YEAR_RE.search(text)
         if match:
             asset_info['vehicle_year'] = match.group(1)
         
         # Extract make
-        make_pattern = r'MAKE[:\s]*([A-Za-z0-9\s]+?)(?:\s+VEH|\s+YEAR|\s+MODEL|:|\n)'
-        match = re.search(make_pattern, text, re.IGNORECASE)
+        match = _MAKE_RE.search(text)
         if match:
             make = match.group(1).strip()
             if make and len(make) < 30:  # Reasonable length
                 asset_info['vehicle_make'] = make
         
         # Extract model
-        model_pattern = r'MODEL[:\s]*([A-Za-z0-9\s]+?)(?:\s+BODY|\s+TYPE|:|\n)'
-        match = re.search(model_pattern, text, re.IGNORECASE)
+        match = _MODEL_RE.search(text)
         if match:
             model = match.group(1).strip()
             if model and len(model) < 30:
                 asset_info['vehicle_model'] = model
         
         # Extract body type
-        body_pattern = r'BODY[:\s]*([A-Za-z0-9\s]+?)(?:\s+MODEL|\s+TYPE|:|\n)'
-        match = re.search(body_pattern, text, re.IGNORECASE)
+        match = _BODY_RE.search(text)
         if match:
             body = match.group(1).strip()
             if body and len(body) < 30:
                 asset_info['body_type'] = body
         
         # Extract damage estimate
-        estimate_patterns = [
-            r'ESTIMATE\s+AMOUNT[:\s]*\$?\s*([0-9,]+\.?\d*)',
-            r'Estimated?\s+Damage[:\s]*\$?\s*([0-9,]+\.?\d*)',
-            r'Damage\s+Estimate[:\s]*\$?\s*([0-9,]+\.?\d*)',
-            r'\$\s*([0-9,]+\.?\d*)\s*(?:damage|estimate)'
-        ]
-        
-        for pattern in estimate_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ESTIMATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 amount_str = match.group(1).replace(',', '').replace('$', '')
                 try:
@@ -356,12 +463,8 @@ class ClaimsProcessor:
                     continue
         
         # Extract damage description
-        damage_patterns = [
-            r'DESCRIBE\s+DAMAGE[:\s]*([^\n]+?)(?:\n[A-Z\s]+:|$)',
-            r'Damage\s+Description[:\s]*([^\n]+)'
-        ]
-        for pattern in damage_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _DAMAGE_DESC_PATTERNS:
+            match = pattern.search(text)
             if match:
                 damage = match.group(1).strip()
                 if damage and len(damage) > 3:
@@ -370,13 +473,55 @@ class ClaimsProcessor:
         
         return asset_info
     
-    def determine_claim_type(self, text: str, extracted_data: Dict) -> str:
-        """Determine the type of claim"""
-        text_lower = text.lower()
+    @classmethod
+    def keyword_matchers(cls) -> tuple:
+        """Return the keyword sets and Aho-Corasick automaton, building them once per class"""
+        if cls.__dict__.get('_keyword_matchers') is None:
+            keyword_sets = {
+                'fraud': frozenset(cls.FRAUD_KEYWORDS),
+                'injury': frozenset(cls.INJURY_INDICATORS),
+                'collision': frozenset(cls.COLLISION_KEYWORDS),
+                'automobile': frozenset(['automobile'])
+            }
+            
+            automaton = None
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for category, keywords in keyword_sets.items():
+                    for keyword in keywords:
+                        categories = automaton.get(keyword, set())
+                        categories.add(category)
+                        automaton.add_word(keyword, categories)
+                automaton.make_automaton()
+            
+            cls._keyword_matchers = (keyword_sets, automaton)
+        return cls._keyword_matchers
+    
+    def scan_keywords(self, text_lower: str) -> set:
+        """Find which keyword categories occur in the lowercased text in a single pass"""
+        keyword_sets, automaton = self.keyword_matchers()
+        
+        if automaton is not None:
+            hits = set()
+            for _, categories in automaton.iter(text_lower):
+                hits.update(categories)
+        else:
+            hits = {
+                category
+                for category, keywords in keyword_sets.items()
+                if any(keyword in text_lower for keyword in keywords)
+            }
         
+        return hits
+    
+    def has_suspicious_phrasing(self, text_lower: str) -> bool:
+        """Check for fraud phrasing that the keyword list does not cover"""
+        return any(pattern.search(text_lower) for pattern in _SUSPICIOUS_PATTERNS)
+    
+    def determine_claim_type(self, keyword_hits: set, extracted_data: Dict) -> str:
+        """Determine the type of claim"""
         # Check for injury claims (highest priority)
-        injury_indicators = ['injured', 'injury', 'extent of injury', 'medical', 'hospital']
-        if any(keyword in text_lower for keyword in injury_indicators):
+        if 'injury' in keyword_hits:
             return 'injury'
         
         # Check asset type
@@ -387,43 +532,29 @@ class ClaimsProcessor:
             return 'property_damage'
         
         # Check for vehicle-related claims
-        if 'vehicle' in asset_type or 'automobile' in text_lower:
+        if 'vehicle' in asset_type or 'automobile' in keyword_hits:
             # Look for collision indicators
-            collision_words = ['collision', 'accident', 'crash', 'hit', 'struck']
-            if any(word in text_lower for word in collision_words):
+            if 'collision' in keyword_hits:
                 return 'vehicle_collision'
             return 'vehicle_damage'
         
         return 'general'
     
-    def check_fraud_indicators(self, text: str) -> bool:
-        """Check for potential fraud indicators in the text"""
-        text_lower = text.lower()
-        
-        # Check for fraud keywords
-        for keyword in self.FRAUD_KEYWORDS:
-            if keyword in text_lower:
-                return True
-        
-        # Additional fraud patterns
-        suspicious_patterns = [
-            r'seems?\s+(?:fake|staged|suspicious)',
-            r'(?:might|could)\s+be\s+fraud',
-            r'doesn\'?t\s+add\s+up'
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+    def check_fraud_indicators(self, keyword_hits: set) -> bool:
+        """Check for potential fraud indicators found by scan_keywords"""
+        return 'fraud' in keyword_hits
     
-    def process_claim(self, file_path: str) -> Dict[str, Any]:
+    def process_claim(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """Main processing function for a claim document"""
         
         # Extract text from file
         text = self.extract_text_from_file(file_path)
         
+        return self.process_text(text, file_path)
+    
+    def process_text(self, text: str, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """Extract fields from a claim's text and route it (file_path names the source)"""
+        
         # Extract all fields
         extracted_fields = {}
         
@@ -443,21 +574,32 @@ class ClaimsProcessor:
         asset_info = self.extract_asset_details(text)
         extracted_fields.update(asset_info)
         
+        # Lowercase once for every keyword check below
+        text_lower = text.lower()
+        
+        # Scan for fraud, injury and collision keywords
+        keyword_hits = self.scan_keywords(text_lower)
+        
         # Determine claim type
-        claim_type = self.determine_claim_type(text, extracted_fields)
+        claim_type = self.determine_claim_type(keyword_hits, extracted_fields)
         extracted_fields['claim_type'] = claim_type
         
         # Check for missing mandatory fields
-        missing_fields = []
-        for field in self.MANDATORY_FIELDS:
-            if field not in extracted_fields or not extracted_fields[field]:
-                missing_fields.append(field)
+        missing_fields = [
+            field for field in self.MANDATORY_FIELDS if not extracted_fields.get(field)
+        ]
+        
+        # Missing fields route to Manual Review before fraud is considered,
+        # so the phrase patterns only need to run for complete claims
+        if not missing_fields and 'fraud' not in keyword_hits:
+            if self.has_suspicious_phrasing(text_lower):
+                keyword_hits.add('fraud')
         
         # Determine routing
         route, reasoning = self.determine_route(
             extracted_fields, 
             missing_fields, 
-            text
+            keyword_hits
         )
         
         # Build result
@@ -476,7 +618,7 @@ class ClaimsProcessor:
         self, 
         extracted_fields: Dict[str, Any], 
         missing_fields: List[str],
-        full_text: str
+        keyword_hits: set
     ) -> tuple:
         """Determine routing and provide reasoning"""
         
@@ -492,7 +634,7 @@ class ClaimsProcessor:
             return route, reasoning
         
         # Rule 2: Check for fraud indicators
-        if self.check_fraud_indicators(full_text):
+        if self.check_fraud_indicators(keyword_hits):
             route = "Investigation Queue"
             reasoning_parts.append(
                 "Potential fraud indicators detected in claim description or documentation"
@@ -536,6 +678,58 @@ class ClaimsProcessor:
         return route, reasoning
 
 
+def result_to_json(data: Any) -> bytes:
+    """Serialize a result as indented UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def process_claims_batch(
+    paths: List[str],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Process several claim files, overlapping file reading with parsing.
+    
+    Text extraction runs in one thread pool and each document is passed to a
+    second pool for field extraction as soon as its text is ready. Results
+    are returned in the same order as paths; a file that cannot be read or
+    processed gets {"file": path, "error": message} in its place, so one bad
+    file does not lose the others. max_workers=None uses the
+    ThreadPoolExecutor default.
+    """
+    processor = ClaimsProcessor()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as readers, \
+            ThreadPoolExecutor(max_workers=max_workers) as parsers:
+        read_futures = {
+            readers.submit(processor.extract_text_from_file, path): index
+            for index, path in enumerate(paths)
+        }
+        
+        parse_futures = [None] * len(paths)
+        results = [None] * len(paths)
+        for future in as_completed(read_futures):
+            index = read_futures[future]
+            try:
+                text = future.result()
+            except Exception as e:
+                results[index] = {"file": str(paths[index]), "error": str(e)}
+                continue
+            parse_futures[index] = parsers.submit(processor.process_text, text, paths[index])
+        
+        for index, future in enumerate(parse_futures):
+            if future is None:
+                continue
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = {"file": str(paths[index]), "error": str(e)}
+        
+        return results
+
+
 def main():
     """Main entry point for the claims processor"""
     import sys
@@ -552,16 +746,16 @@ def main():
         print("=" * 60)
         sys.exit(1)
     
-    file_path = sys.argv[1]
+    file_path = Path(sys.argv[1])
     
-    if not Path(file_path).exists():
+    if not file_path.exists():
         print(f"Error: File not found - {file_path}")
         sys.exit(1)
     
     print("=" * 60)
     print("PROCESSING INSURANCE CLAIM")
     print("=" * 60)
-    print(f"File: {Path(file_path).name}")
+    print(f"File: {file_path.name}")
     print("-" * 60)
     
     try:
@@ -591,12 +785,12 @@ def main():
         print("\n" + "=" * 60)
         print("JSON OUTPUT:")
         print("=" * 60)
-        print(json.dumps(result, indent=2))
+        result_json = result_to_json(result)
+        print(result_json.decode('utf-8'))
         
         # Save to file
-        output_file = Path(file_path).stem + "_processed.json"
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        output_file = file_path.stem + "_processed.json"
+        Path(output_file).write_bytes(result_json)
         
         print("\n" + "=" * 60)
         print(f"✓ Results saved to: {output_file}")
@@ -604,8 +798,9 @@ def main():
         
     except Exception as e:
         print(f"\Error processing claim: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if DEBUG:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 
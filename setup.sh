@@ -64,5 +64,7 @@ echo "  - sample_claim.txt (injury/specialist queue)"
 echo "  - sample_claim_fasttrack.txt (low damage)"
 echo "  - sample_claim_fraud.txt (investigation)"
 echo "  - sample_claim_incomplete.txt (manual review)"
+echo "  - sample_claim_injury_fraud.txt (fraud + injury + collision)"
+echo "  - sample_claim_multipage.txt (vehicle details on page 2)"
 echo ""
 echo "============================================================"